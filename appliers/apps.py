@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AppliersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'appliers'
+
+    def ready(self):
+        from appliers import signals  # noqa: F401
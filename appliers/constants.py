@@ -13,10 +13,34 @@ QUALIFIED_CHOICES = [
     QUALIFIED_PENDING,
 ]
 
+# Application source products
+SOURCE_PRODUCT_INDEED = "Indeed"
+SOURCE_PRODUCT_LINKEDIN = "LinkedIn"
+SOURCE_PRODUCT_INTERNAL = "Internal"
+
+SOURCE_PRODUCTS = [
+    SOURCE_PRODUCT_INDEED,
+    SOURCE_PRODUCT_LINKEDIN,
+    SOURCE_PRODUCT_INTERNAL,
+]
+
 # Search parameters
 DEFAULT_SEARCH_RADIUS_KM = 20.0
 MIN_RADIUS_KM = 0.1
 MAX_RADIUS_KM = 100.0
+DEFAULT_SEARCH_LIMIT = 100
+MAX_SEARCH_LIMIT = 500
+MAX_SEARCH_OFFSET = 1_000  # each status query walks offset + limit KNN rows
+SEARCH_CACHE_TIMEOUT = 60  # seconds a cached search response is served
+
+# Search ranking: distance multiplier per qualified status, so that closer but
+# less qualified appliers can still rank after farther qualified ones
+QUALIFIED_PENALTIES = {
+    QUALIFIED_YES: 1.0,
+    QUALIFIED_PENDING: 1.5,
+    QUALIFIED_NO: 2.0,
+}
+DEFAULT_QUALIFIED_PENALTY = 3.0  # appliers without a qualified status
 
 # Geographic constants
 WGS84_SRID = 4326  # World Geodetic System 1984 coordinate reference system
\ No newline at end of file
@@ -1,14 +1,30 @@
 import logging
+from typing import Any
 from django import forms
 from appliers.constants import (
     QUALIFIED_CHOICES,
     DEFAULT_SEARCH_RADIUS_KM,
+    DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
+    MAX_SEARCH_OFFSET,
     MIN_RADIUS_KM,
     MAX_RADIUS_KM,
 )
 
 logger = logging.getLogger(__name__)
 
+# Accepted spellings of each qualified status, so the common cases are a single
+# dict lookup (anything else falls back to upper())
+QUALIFIED_NORMALIZED = {
+    **{choice: choice for choice in QUALIFIED_CHOICES},
+    **{choice.lower(): choice for choice in QUALIFIED_CHOICES},
+}
+QUALIFIED_ERROR = f'Invalid qualified parameter. Must be one of: {", ".join(QUALIFIED_CHOICES)}.'
+
+# Accepted values of the distance flag (matched case-insensitively)
+DISTANCE_VALUES = {"true": True, "1": True, "false": False, "0": False}
+DISTANCE_ERROR = f'Invalid distance parameter. Must be one of: {", ".join(DISTANCE_VALUES)}.'
+
 class ApplierSearchForm(forms.Form):
     """
     Form for validating applier search parameters.
@@ -18,6 +34,9 @@ class ApplierSearchForm(forms.Form):
     - lon: Required longitude coordinate (-180 to 180)
     - qualified: Optional qualification status (YES, NO, PENDING)
     - radius: Optional search radius in kilometers (default: 20km)
+    - limit: Optional page size (default: 100)
+    - offset: Optional number of results to skip (default: 0)
+    - distance: Optional flag to include distance_km (default: true)
     """
 
     lat = forms.FloatField(
@@ -44,13 +63,9 @@ class ApplierSearchForm(forms.Form):
         }
     )
 
-    qualified = forms.ChoiceField(
-        required=False,
-        choices=[(choice, choice) for choice in QUALIFIED_CHOICES],
-        error_messages={
-            'invalid_choice': f'Invalid qualified parameter. Must be one of: {", ".join(QUALIFIED_CHOICES)}.',
-        }
-    )
+    # Validated in clean_qualified: a ChoiceField would reject "yes" before it
+    # could be normalized
+    qualified = forms.CharField(required=False)
 
     radius = forms.FloatField(
         required=False,
@@ -64,18 +79,87 @@ class ApplierSearchForm(forms.Form):
         }
     )
 
+    limit = forms.IntegerField(
+        required=False,
+        initial=DEFAULT_SEARCH_LIMIT,
+        min_value=1,
+        max_value=MAX_SEARCH_LIMIT,
+        error_messages={
+            'invalid': 'Invalid limit parameter. Must be a whole number.',
+            'min_value': 'Limit must be at least 1.',
+            'max_value': f'Limit must not exceed {MAX_SEARCH_LIMIT}.',
+        }
+    )
+
+    offset = forms.IntegerField(
+        required=False,
+        initial=0,
+        min_value=0,
+        max_value=MAX_SEARCH_OFFSET,
+        error_messages={
+            'invalid': 'Invalid offset parameter. Must be a whole number.',
+            'min_value': 'Offset must not be negative.',
+            'max_value': f'Offset must not exceed {MAX_SEARCH_OFFSET}.',
+        }
+    )
+
+    # Validated in clean_distance: "0"/"false" opt out of the exact per-row
+    # distance, "1"/"true" (or leaving it out) keep it
+    distance = forms.CharField(required=False)
+
     def clean_qualified(self) -> str | None:
-        """Normalize qualified parameter to uppercase."""
+        """Normalize qualified parameter to uppercase (case-insensitive)."""
         qualified = self.cleaned_data.get('qualified')
-        if qualified:
-            return qualified.upper()
-        return None
+        if not qualified:
+            return None
+        normalized = QUALIFIED_NORMALIZED.get(qualified) or QUALIFIED_NORMALIZED.get(
+            qualified.upper()
+        )
+        if normalized is None:
+            raise forms.ValidationError(QUALIFIED_ERROR, code='invalid_choice')
+        return normalized
 
     def clean_radius(self) -> float:
         """Return radius or default value."""
         radius = self.cleaned_data.get('radius')
         return radius if radius is not None else DEFAULT_SEARCH_RADIUS_KM
 
+    def clean_limit(self) -> int:
+        """Return limit or default value."""
+        limit = self.cleaned_data.get('limit')
+        return limit if limit is not None else DEFAULT_SEARCH_LIMIT
+
+    def clean_offset(self) -> int:
+        """Return offset or default value."""
+        offset = self.cleaned_data.get('offset')
+        return offset if offset is not None else 0
+
+    def clean_distance(self) -> bool:
+        """Return distance flag, included unless explicitly disabled."""
+        distance = self.cleaned_data.get('distance')
+        if not distance:
+            return True
+        include_distance = DISTANCE_VALUES.get(distance.lower())
+        if include_distance is None:
+            raise forms.ValidationError(DISTANCE_ERROR, code='invalid')
+        return include_distance
+
+    def get_search_params(self) -> dict[str, Any]:
+        """
+        Map the cleaned data to ApplierSearchService.search_by_location arguments.
+
+        Only valid after is_valid() returned True.
+        """
+        return {
+            "latitude": self.cleaned_data["lat"],
+            "longitude": self.cleaned_data["lon"],
+            "qualified": self.cleaned_data["qualified"],
+            "radius_km": self.cleaned_data["radius"],
+            "limit": self.cleaned_data["limit"],
+            "offset": self.cleaned_data["offset"],
+            "include_distance": self.cleaned_data["distance"],
+        }
+
     def get_error_message(self) -> str:
         """Extract first error message from form errors."""
         errors = self.errors.as_data()
@@ -90,4 +174,4 @@ class ApplierSearchForm(forms.Form):
             },
         )
 
-        return error_message
\ No newline at end of file
+        return error_message
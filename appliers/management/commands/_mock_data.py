@@ -0,0 +1,113 @@
+"""
+Mock row generators for the populate_db command.
+
+These run in worker processes. The module deliberately imports nothing from
+Django, so workers started with spawn or forkserver (the defaults on macOS and,
+from Python 3.14, on Linux) can import it without django.setup().
+"""
+import csv
+import io
+import random
+
+from faker import Faker
+
+from appliers.constants import SOURCE_PRODUCTS, WGS84_SRID
+
+
+fake = Faker()
+
+# Each batch gets its own seed so workers don't repeat each other's data. Rows
+# are streamed from a generator straight into CSV text, which is far more
+# compact than holding thousands of tuples per batch until they are loaded.
+
+user_ids = []
+applier_ids = []
+
+
+def init_worker(reserved_user_ids, reserved_applier_ids):
+    global user_ids, applier_ids
+    user_ids = reserved_user_ids
+    applier_ids = reserved_applier_ids
+
+
+def generate_batch(job):
+    """Pool.imap entry point: call the job's generator with the job's arguments."""
+    generator, *args = job
+    return generator(*args)
+
+
+def to_csv(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def generate_users(seed, ids, emails, now):
+    fake.seed_instance(seed)
+    return to_csv(
+        (
+            user_id,
+            fake.uuid4(),
+            fake.first_name(),
+            fake.last_name(),
+            email,
+            fake.phone_number(),
+            fake.image_url(),
+            fake.country_code(),
+            fake.image_url(),
+            now,
+            now,
+        )
+        for user_id, email in zip(ids, emails)
+    )
+
+
+def generate_appliers(seed, ids, now):
+    fake.seed_instance(seed)
+    rng = random.Random(seed)
+    # Draw the random columns for the whole batch at once rather than per row
+    count = len(ids)
+    applier_user_ids = rng.choices(user_ids, k=count)  # Random, real users
+    products = rng.choices(SOURCE_PRODUCTS, k=count)
+    qualified = rng.choices(["YES", "NO", "PENDING"], k=count)
+    return to_csv(
+        (
+            applier_id,
+            fake.uuid4(),
+            user_id,
+            product,
+            fake.boolean(),
+            qualified_status,
+            # EWKT, parsed into geography by COPY. Plain floats from the RNG are
+            # much cheaper than Faker's Decimal-based latitude()/longitude()
+            f"SRID={WGS84_SRID};POINT({rng.uniform(-180, 180):.6f} {rng.uniform(-90, 90):.6f})",
+            now,
+            now,
+        )
+        for applier_id, user_id, product, qualified_status in zip(
+            ids, applier_user_ids, products, qualified
+        )
+    )
+
+
+def generate_questions(seed, count, now):
+    fake.seed_instance(seed)
+    rng = random.Random(seed)
+    # Draw the random columns for the whole batch at once rather than per row
+    application_ids = rng.choices(applier_ids, k=count)  # Random, real applications
+    types = rng.choices(["TEXT", "VIDEO", "FILE"], k=count)
+    skipped = rng.choices([True, False], weights=[15, 85], k=count)
+    return to_csv(
+        (
+            application_id,
+            fake.sentence(nb_words=10).replace(".", "?"),
+            question_type,
+            fake.sentence(nb_words=15),
+            is_skipped,
+            now,
+            now,
+        )
+        for application_id, question_type, is_skipped in zip(
+            application_ids, types, skipped
+        )
+    )
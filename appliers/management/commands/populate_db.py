@@ -1,14 +1,26 @@
+import io
+import itertools
 import random
 import time
-
+from multiprocessing import Pool
+
+from appliers.management.commands._mock_data import (
+    fake,
+    generate_appliers,
+    generate_batch,
+    generate_questions,
+    generate_users,
+    init_worker,
+)
 from appliers.models import (
     Applier,
     ScreeningQuestion,
     User,
 )
+from appliers.services.search_service import clear_search_cache
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from faker import Faker
+from django.db import connection, transaction
+from django.utils import timezone
 
 
 USER_COUNT = 70_000
@@ -16,8 +28,69 @@ APPLIER_COUNT = 150_000
 QUESTION_COUNT = 1_000_000
 BATCH_SIZE = 5_000
 
+USER_FIELDS = (
+    "id",
+    "external_id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "cover_letter",
+    "country",
+    "resume",
+    "created_at",
+    "updated_at",
+)
+APPLIER_FIELDS = (
+    "id",
+    "external_id",
+    "user_id",
+    "source_product",
+    "source_is_premium",
+    "qualified",
+    "location",
+    "created_at",
+    "updated_at",
+)
+QUESTION_FIELDS = (
+    "application_id",
+    "question",
+    "type",
+    "answer",
+    "is_skipped",
+    "created_at",
+    "updated_at",
+)
+
 
-fake = Faker()
+def reserve_ids(model, count):
+    """
+    Draw ``count`` ids from the model's id sequence.
+
+    Sequence values are never handed out twice, so rows can be generated with
+    their final ids (and foreign keys to them) before anything is inserted.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+            [model._meta.db_table, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def copy_csv(model, fields, data):
+    """
+    Load CSV text into the model's table with COPY instead of parameterized INSERTs.
+
+    Each line holds the values of ``fields`` in order.
+    """
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    columns = ", ".join(quote(model._meta.get_field(field).column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", io.StringIO(data)
+        )
 
 
 class Command(BaseCommand):
@@ -33,37 +106,44 @@ class Command(BaseCommand):
             )
         )
 
-        with transaction.atomic():
-            # === Phase 1: Generate Users ===
+        # COPY bypasses auto_now/auto_now_add, so timestamps are set explicitly
+        now = timezone.now()
+
+        # unique.email() only dedupes within a process, so emails are drawn here
+        emails = [fake.unique.email() for _ in range(USER_COUNT)]
+        seeds = itertools.count(random.randrange(2**32))
+        reserved_user_ids = reserve_ids(User, USER_COUNT)
+        reserved_applier_ids = reserve_ids(Applier, APPLIER_COUNT)
+        # Forked workers would inherit the open database socket, close it first
+        # (the transaction below reconnects)
+        connection.close()
+
+        # Faker is CPU-bound, so batches are generated in parallel. imap yields
+        # them in order as the workers finish, and each batch is copied and
+        # dropped right away. COPY is much faster than generation, so only the
+        # few batches the workers are ahead by are held, not the whole data set.
+        with Pool(
+            initializer=init_worker,
+            initargs=(reserved_user_ids, reserved_applier_ids),
+        ) as pool, transaction.atomic():
+            # === Phase 1: Insert Users ===
             start_time = time.time()
-            self.stdout.write("Generating Users...")
-            users_to_create = []
-            user_ids = []  # We need these to link Appliers
-
-            for i in range(USER_COUNT):
-                users_to_create.append(
-                    User(
-                        external_id=fake.uuid4(),
-                        first_name=fake.first_name(),
-                        last_name=fake.last_name(),
-                        email=fake.unique.email(),
-                        phone=fake.phone_number(),
-                        cover_letter=fake.image_url(),
-                        country=fake.country_code(),
-                        resume=fake.image_url(),
+            self.stdout.write("Inserting Users...")
+
+            user_batches = pool.imap(
+                generate_batch,
+                (
+                    (generate_users, next(seeds), ids, batch_emails, now)
+                    for ids, batch_emails in zip(
+                        itertools.batched(reserved_user_ids, BATCH_SIZE),
+                        itertools.batched(emails, BATCH_SIZE),
                     )
-                )
-
-                if (i + 1) % BATCH_SIZE == 0:
-                    created_users = User.objects.bulk_create(users_to_create)
-                    user_ids.extend([user.id for user in created_users])
-                    users_to_create = []
-                    self.stdout.write(f"  Created {i + 1}/{USER_COUNT} users...")
-
-            # Create any remaining users
-            if users_to_create:
-                created_users = User.objects.bulk_create(users_to_create)
-                user_ids.extend([user.id for user in created_users])
+                ),
+            )
+            for i, data in enumerate(user_batches):
+                copy_csv(User, USER_FIELDS, data)
+                created = min((i + 1) * BATCH_SIZE, USER_COUNT)
+                self.stdout.write(f"  Created {created}/{USER_COUNT} users...")
 
             end_time = time.time()
             self.stdout.write(
@@ -72,39 +152,21 @@ class Command(BaseCommand):
                 )
             )
 
-            # === Phase 2: Generate Appliers ===
+            # === Phase 2: Insert Appliers ===
             start_time = time.time()
-            self.stdout.write("Generating Appliers...")
-            appliers_to_create = []
-            applier_ids = []  # We need these to link ScreeningQuestions
-
-            for i in range(APPLIER_COUNT):
-                appliers_to_create.append(
-                    Applier(
-                        external_id=fake.uuid4(),
-                        user_id=random.choice(user_ids),  # Link to a random, real user
-                        source={
-                            "product": random.choice(
-                                ["Indeed", "LinkedIn", "Internal"]
-                            ),
-                            "isPremium": fake.boolean(),
-                        },
-                        qualified=random.choice(["YES", "NO", "PENDING"]),
-                        latitude=fake.latitude(),
-                        longitude=fake.longitude(),
-                    )
-                )
-
-                if (i + 1) % BATCH_SIZE == 0:
-                    created_appliers = Applier.objects.bulk_create(appliers_to_create)
-                    applier_ids.extend([applier.id for applier in created_appliers])
-                    appliers_to_create = []
-                    self.stdout.write(f"  Created {i + 1}/{APPLIER_COUNT} appliers...")
-
-            # Create any remaining appliers
-            if appliers_to_create:
-                created_appliers = Applier.objects.bulk_create(appliers_to_create)
-                applier_ids.extend([applier.id for applier in created_appliers])
+            self.stdout.write("Inserting Appliers...")
+
+            applier_batches = pool.imap(
+                generate_batch,
+                (
+                    (generate_appliers, next(seeds), ids, now)
+                    for ids in itertools.batched(reserved_applier_ids, BATCH_SIZE)
+                ),
+            )
+            for i, data in enumerate(applier_batches):
+                copy_csv(Applier, APPLIER_FIELDS, data)
+                created = min((i + 1) * BATCH_SIZE, APPLIER_COUNT)
+                self.stdout.write(f"  Created {created}/{APPLIER_COUNT} appliers...")
 
             end_time = time.time()
             self.stdout.write(
@@ -113,34 +175,21 @@ class Command(BaseCommand):
                 )
             )
 
-            # === Phase 3: Generate Screening Questions ===
+            # === Phase 3: Insert Screening Questions ===
             start_time = time.time()
-            self.stdout.write("Generating Screening Questions...")
-            questions_to_create = []
-
-            for i in range(QUESTION_COUNT):
-                questions_to_create.append(
-                    ScreeningQuestion(
-                        application_id=random.choice(
-                            applier_ids
-                        ),  # Link to a random, real application
-                        question=fake.sentence(nb_words=10).replace(".", "?"),
-                        type=random.choice(["TEXT", "VIDEO", "FILE"]),
-                        answer=fake.sentence(nb_words=15),
-                        is_skipped=fake.boolean(chance_of_getting_true=15),
-                    )
-                )
-
-                if (i + 1) % BATCH_SIZE == 0:
-                    ScreeningQuestion.objects.bulk_create(questions_to_create)
-                    questions_to_create = []
-                    self.stdout.write(
-                        f"  Created {i + 1}/{QUESTION_COUNT} questions..."
-                    )
-
-            # Create any remaining questions
-            if questions_to_create:
-                ScreeningQuestion.objects.bulk_create(questions_to_create)
+            self.stdout.write("Inserting Screening Questions...")
+
+            question_batches = pool.imap(
+                generate_batch,
+                (
+                    (generate_questions, next(seeds), len(batch), now)
+                    for batch in itertools.batched(range(QUESTION_COUNT), BATCH_SIZE)
+                ),
+            )
+            for i, data in enumerate(question_batches):
+                copy_csv(ScreeningQuestion, QUESTION_FIELDS, data)
+                created = min((i + 1) * BATCH_SIZE, QUESTION_COUNT)
+                self.stdout.write(f"  Created {created}/{QUESTION_COUNT} questions...")
 
             end_time = time.time()
             self.stdout.write(
@@ -149,4 +198,12 @@ class Command(BaseCommand):
                 )
             )
 
+        # COPY sends no signals, so drop searches cached before the new rows existed
+        clear_search_cache()
+
+        # Refresh planner statistics, autovacuum would only get to it later
+        with connection.cursor() as cursor:
+            for model in (User, Applier, ScreeningQuestion):
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}")
+
         self.stdout.write(self.style.SUCCESS("Database population complete!"))
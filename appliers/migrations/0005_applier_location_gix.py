@@ -0,0 +1,31 @@
+import appliers.models
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('appliers', '0004_applier_location'),
+    ]
+
+    operations = [
+        # location is added with raw SQL in 0004, register it with the migration
+        # state so the index below can reference it
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='applier',
+                    name='location',
+                    field=appliers.models.GeneratedPointField(blank=True, geography=True, null=True, spatial_index=False, srid=4326),
+                ),
+            ],
+        ),
+        AddIndexConcurrently(
+            model_name='applier',
+            index=GistIndex(fields=['location'], name='appliers_applier_location_gix'),
+        ),
+    ]
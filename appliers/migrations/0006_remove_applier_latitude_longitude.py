@@ -0,0 +1,68 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appliers', '0005_applier_location_gix'),
+    ]
+
+    operations = [
+        # Turn the generated column into a plain one, keeping its values, so
+        # location becomes the only copy of the coordinates
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql="""
+                        ALTER TABLE appliers_applier
+                        ALTER COLUMN location DROP EXPRESSION;
+                    """,
+                    reverse_sql="""
+                        ALTER TABLE appliers_applier
+                        DROP COLUMN location;
+
+                        ALTER TABLE appliers_applier
+                        ADD COLUMN location geography(Point, 4326)
+                        GENERATED ALWAYS AS (
+                            ST_SetSRID(
+                                ST_MakePoint(
+                                    longitude::double precision,
+                                    latitude::double precision
+                                ),
+                                4326
+                            )
+                        ) STORED;
+
+                        CREATE INDEX appliers_applier_location_gix
+                        ON appliers_applier USING GIST (location);
+                    """,
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='applier',
+                    name='location',
+                    field=django.contrib.gis.db.models.fields.PointField(blank=True, geography=True, null=True, spatial_index=False, srid=4326),
+                ),
+            ],
+        ),
+        # Only needed when migrating backwards: restore the decimals from the point
+        migrations.RunSQL(
+            sql=migrations.RunSQL.noop,
+            reverse_sql="""
+                UPDATE appliers_applier
+                SET latitude = ST_Y(location::geometry),
+                    longitude = ST_X(location::geometry)
+                WHERE location IS NOT NULL;
+            """,
+        ),
+        migrations.RemoveField(
+            model_name='applier',
+            name='latitude',
+        ),
+        migrations.RemoveField(
+            model_name='applier',
+            name='longitude',
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGistExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('appliers', '0006_remove_applier_latitude_longitude'),
+    ]
+
+    operations = [
+        # btree_gist provides the GiST operator class for the varchar column
+        BtreeGistExtension(),
+        AddIndexConcurrently(
+            model_name='applier',
+            index=GistIndex(fields=['qualified', 'location'], name='appliers_applier_q_loc_gix'),
+        ),
+    ]
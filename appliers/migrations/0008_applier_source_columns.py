@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-15 05:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appliers', '0007_applier_q_loc_gix'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applier',
+            name='source_product',
+            field=models.CharField(blank=True, choices=[('Indeed', 'Indeed'), ('LinkedIn', 'LinkedIn'), ('Internal', 'Internal')], max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='applier',
+            name='source_is_premium',
+            field=models.BooleanField(blank=True, null=True),
+        ),
+        # Copy the two keys out of the JSON document in a single UPDATE. Any other
+        # keys are dropped with the column and cannot be restored by the reverse
+        migrations.RunSQL(
+            sql="""
+                UPDATE appliers_applier
+                SET source_product = source->>'product',
+                    source_is_premium = (source->>'isPremium')::boolean
+                WHERE source IS NOT NULL
+            """,
+            reverse_sql="""
+                UPDATE appliers_applier
+                SET source = jsonb_build_object(
+                    'product', source_product, 'isPremium', source_is_premium
+                )
+                WHERE source_product IS NOT NULL OR source_is_premium IS NOT NULL
+            """,
+        ),
+        migrations.RemoveField(
+            model_name='applier',
+            name='source',
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appliers', '0008_applier_source_columns'),
+    ]
+
+    operations = [
+        # Real applier locations cluster around cities, a larger sample gives the planner
+        # better ST_DWithin selectivity estimates than the default target of 100
+        migrations.RunSQL(
+            sql="ALTER TABLE appliers_applier ALTER COLUMN location SET STATISTICS 1000",
+            reverse_sql="ALTER TABLE appliers_applier ALTER COLUMN location SET STATISTICS -1",
+        ),
+        migrations.RunSQL(
+            sql="ANALYZE appliers_applier",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
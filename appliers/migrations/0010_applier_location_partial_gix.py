@@ -0,0 +1,42 @@
+from django.contrib.postgres.indexes import GistIndex
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('appliers', '0009_applier_location_statistics'),
+    ]
+
+    operations = [
+        # one partial index per qualified status replaces the composite
+        # (qualified, location) index and the plain location index, which no query
+        # needs any more; the new ones are built before the old ones are dropped
+        AddIndexConcurrently(
+            model_name='applier',
+            index=GistIndex(condition=models.Q(('qualified', 'YES')), fields=['location'], name='applier_loc_yes_gix'),
+        ),
+        AddIndexConcurrently(
+            model_name='applier',
+            index=GistIndex(condition=models.Q(('qualified', 'PENDING')), fields=['location'], name='applier_loc_pending_gix'),
+        ),
+        AddIndexConcurrently(
+            model_name='applier',
+            index=GistIndex(condition=models.Q(('qualified', 'NO')), fields=['location'], name='applier_loc_no_gix'),
+        ),
+        AddIndexConcurrently(
+            model_name='applier',
+            index=GistIndex(condition=models.Q(('qualified__isnull', True)), fields=['location'], name='applier_loc_null_gix'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='applier',
+            name='appliers_applier_q_loc_gix',
+        ),
+        RemoveIndexConcurrently(
+            model_name='applier',
+            name='appliers_applier_location_gix',
+        ),
+    ]
@@ -1,11 +1,16 @@
 from django.db import models
+from django.db.models import FloatField, Func
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GistIndex
 from django.contrib.gis.geos import Point
 
 from appliers.constants import (
     QUALIFIED_YES,
     QUALIFIED_NO,
     QUALIFIED_PENDING,
+    SOURCE_PRODUCT_INDEED,
+    SOURCE_PRODUCT_LINKEDIN,
+    SOURCE_PRODUCT_INTERNAL,
     WGS84_SRID,
 )
 
@@ -32,34 +37,115 @@ class User(TimeStampedModel):
         return self.name
 
 # prevents Django from setting this db-generated field
+# (location was generated until 0006, kept for the historical migrations)
 class GeneratedPointField(gis_models.PointField):
     generated = True
 
+# Columns of an applier row as ApplierSerializer.from_values_list reads them, in
+# order (latitude and longitude are the ApplierQuerySet.with_coordinates annotations)
+APPLIER_VALUES_FIELDS = (
+    "id",
+    "external_id",
+    "qualified",
+    "source_product",
+    "source_is_premium",
+    "created_at",
+    "user_id",
+    "user__first_name",
+    "user__last_name",
+    "user__email",
+    "latitude",
+    "longitude",
+)
+
+
+def point_coordinate(function: str) -> Func:
+    """
+    Read a coordinate of Applier.location as a float in SQL.
+
+    ST_X/ST_Y only accept geometry; the cast is lossless for points.
+    """
+    return Func(
+        "location",
+        function=function,
+        template="%(function)s(%(expressions)s::geometry)",
+        output_field=FloatField(),
+    )
+
+
+class ApplierQuerySet(models.QuerySet):
+    def with_coordinates(self, *fields):
+        """
+        Read APPLIER_VALUES_FIELDS rows, followed by ``fields``, as values_list() tuples.
+
+        Adds the latitude/longitude annotations those rows need, so callers
+        cannot select them without the ST_Y/ST_X that produce them.
+        """
+        return self.annotate(
+            latitude=point_coordinate("ST_Y"),
+            longitude=point_coordinate("ST_X"),
+        ).values_list(*APPLIER_VALUES_FIELDS, *fields)
+
+
 class Applier(TimeStampedModel):
     QUALIFIED_CHOICES = [
         (QUALIFIED_YES, "Yes"),
         (QUALIFIED_NO, "No"),
         (QUALIFIED_PENDING, "Pending"),
     ]
+    SOURCE_PRODUCT_CHOICES = [
+        (SOURCE_PRODUCT_INDEED, "Indeed"),
+        (SOURCE_PRODUCT_LINKEDIN, "LinkedIn"),
+        (SOURCE_PRODUCT_INTERNAL, "Internal"),
+    ]
 
     external_id = models.CharField(max_length=100)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    source = models.JSONField(null=True, blank=True)
+    # Application source, plain columns rather than a jsonb document
+    source_product = models.CharField(
+        max_length=20, choices=SOURCE_PRODUCT_CHOICES, null=True, blank=True
+    )
+    source_is_premium = models.BooleanField(null=True, blank=True)
     qualified = models.CharField(
         max_length=20, choices=QUALIFIED_CHOICES, null=True, blank=True
     )
-    latitude = models.DecimalField(
-        max_digits=9, decimal_places=6, null=True, blank=True
-    )
-    longitude = models.DecimalField(
-        max_digits=9, decimal_places=6, null=True, blank=True
-    )
-    
-    # PostGIS PointField for efficient spatial queries
-    location = GeneratedPointField(
-        geography=True, null=True, blank=True, srid=WGS84_SRID
+
+    # PostGIS PointField for efficient spatial queries, the only copy of the
+    # coordinates (longitude is x, latitude is y)
+    location = gis_models.PointField(
+        geography=True, null=True, blank=True, srid=WGS84_SRID, spatial_index=False
     )
 
+    objects = ApplierQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Back the ST_DWithin radius filter and <-> ordering of search_by_location.
+            # Every search query filters one qualified status (NULL included), so
+            # each status gets its own partial index holding only its points and
+            # no plain location index is kept
+            GistIndex(
+                fields=["location"],
+                condition=models.Q(qualified=QUALIFIED_YES),
+                name="applier_loc_yes_gix",
+            ),
+            GistIndex(
+                fields=["location"],
+                condition=models.Q(qualified=QUALIFIED_PENDING),
+                name="applier_loc_pending_gix",
+            ),
+            GistIndex(
+                fields=["location"],
+                condition=models.Q(qualified=QUALIFIED_NO),
+                name="applier_loc_no_gix",
+            ),
+            GistIndex(
+                fields=["location"],
+                condition=models.Q(qualified__isnull=True),
+                name="applier_loc_null_gix",
+            ),
+        ]
+
 class ScreeningQuestion(TimeStampedModel):
     application = models.ForeignKey(
         Applier, on_delete=models.CASCADE, related_name="screening_questions"
@@ -1,73 +1,73 @@
 """
 Serializers for appliers application.
 """
-from typing import Dict, Any, Optional
-from appliers.models import Applier, User
-
-
-class UserSerializer:
-    """
-    Serializer for User model.
-    """
-
-    @staticmethod
-    def to_dict(user: User) -> Dict[str, Any]:
-        """
-        Serialize a User instance to a dictionary.
-
-        Args:
-            user: User model instance
-
-        Returns:
-            dict: Serialized user data
-        """
-        return {
-            "user_id": user.id,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "email": user.email,
-        }
+from typing import Dict, Any, Tuple
 
 
 class ApplierSerializer:
     """
-    Serializer for Applier model with nested User serialization.
+    Serializer for Applier rows with the nested user columns joined in.
+
+    from_values_list is the single implementation of the response shape, shared
+    by the list and search endpoints.
     """
 
     @staticmethod
-    def to_dict(applier: Applier, include_distance: bool = False) -> Dict[str, Any]:
+    def from_values_list(
+        row: Tuple[Any, ...], include_distance: bool = False
+    ) -> Dict[str, Any]:
         """
-        Serialize an Applier instance to a dictionary.
+        Serialize an applier values_list() row to a dictionary.
+
+        Reads the columns as plain tuples (see ApplierQuerySet.with_coordinates),
+        which skips building a dict per row.
 
         Args:
-            applier: Applier model instance
+            row: Applier row as returned by Applier.objects.with_coordinates(),
+                optionally followed by the distance in meters
             include_distance: Whether to include distance_km field (for search results)
 
         Returns:
             dict: Serialized applier data with nested user
         """
-        # Convert Decimal to float for JSON serialization
-        latitude: Optional[float] = (
-            float(applier.latitude) if applier.latitude is not None else None
-        )
-        longitude: Optional[float] = (
-            float(applier.longitude) if applier.longitude is not None else None
-        )
-
+        (
+            applier_id,
+            external_id,
+            qualified,
+            source_product,
+            source_is_premium,
+            created_at,
+            user_id,
+            first_name,
+            last_name,
+            email,
+            latitude,
+            longitude,
+            *distance,
+        ) = row
         data = {
-            "applier_id": applier.id,
-            "external_id": applier.external_id,
-            "qualified": applier.qualified,
+            "applier_id": applier_id,
+            "external_id": external_id,
+            "qualified": qualified,
             "latitude": latitude,
             "longitude": longitude,
-            "user": UserSerializer.to_dict(applier.user),
-            "source": applier.source,
-            "created_at": applier.created_at,
+            "user": {
+                "user_id": user_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+            },
+            # null like the former jsonb column when the applier has no source
+            "source": (
+                None
+                if source_product is None and source_is_premium is None
+                else {"product": source_product, "isPremium": source_is_premium}
+            ),
+            "created_at": created_at,
         }
 
-        # Add distance if available (for search results)
-        if include_distance and hasattr(applier, "distance"):
-            distance_km: float = applier.distance.km if applier.distance else 0.0
-            data["distance_km"] = round(distance_km, 2)
+        # Add distance if available (for search results, in meters)
+        if include_distance and distance:
+            data["distance_km"] = round((distance[0] or 0.0) / 1000, 2)
 
         return data
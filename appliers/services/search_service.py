@@ -2,17 +2,22 @@
 Service layer for applier-related business logic.
 """
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Any, List, Tuple
 
+from django.contrib.gis.db.models import GeometryField
 from django.contrib.gis.geos import Point
-from django.contrib.gis.db.models.functions import Distance
-from django.contrib.gis.measure import D
-from django.db.models import QuerySet, Case, When, F, FloatField
+from django.contrib.gis.db.models.functions import Distance, GeometryDistance
+from django.core.cache import cache
+from django.db.models import ExpressionWrapper, FloatField, Value
 
 from appliers.models import Applier
 from appliers.constants import (
     WGS84_SRID,
     DEFAULT_SEARCH_RADIUS_KM,
+    DEFAULT_SEARCH_LIMIT,
+    QUALIFIED_PENALTIES,
+    DEFAULT_QUALIFIED_PENALTY,
     QUALIFIED_YES,
     QUALIFIED_PENDING,
     QUALIFIED_NO,
@@ -20,6 +25,51 @@ from appliers.constants import (
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CACHE_VERSION_KEY = "appliers:search:version"
+
+# Qualified statuses searched when no filter is given (NULL is a status of its own)
+ALL_STATUSES = (QUALIFIED_YES, QUALIFIED_PENDING, QUALIFIED_NO, None)
+
+# Output field of the geography search point literal, shared by every query
+GEOGRAPHY_FIELD = GeometryField(srid=WGS84_SRID, geography=True)
+
+
+def search_cache_key(
+    latitude: float,
+    longitude: float,
+    qualified: Optional[str],
+    radius_km: float,
+    limit: int,
+    offset: int,
+    include_distance: bool = True,
+) -> str:
+    """
+    Build the cache key of a search response.
+
+    The key embeds the current search cache version, so bumping it in
+    clear_search_cache() orphans every earlier entry at once.
+    """
+    version = cache.get_or_set(SEARCH_CACHE_VERSION_KEY, time.time_ns, timeout=None)
+    return (
+        f"appliers:search:{version}:{latitude!r}:{longitude!r}:{qualified}:"
+        f"{radius_km!r}:{limit}:{offset}:{int(include_distance)}"
+    )
+
+
+def clear_search_cache() -> None:
+    """
+    Invalidate all cached search responses.
+
+    Called once Applier/User saves and deletes commit (see appliers.signals).
+    Bulk writes that bypass signals (QuerySet.update, bulk_create, populate_db)
+    must call it themselves.
+    """
+    try:
+        cache.incr(SEARCH_CACHE_VERSION_KEY)
+    except ValueError:
+        # Version not set (or evicted): start from a value no earlier key used
+        cache.set(SEARCH_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
 
 class ApplierSearchService:
     """
@@ -32,22 +82,40 @@ class ApplierSearchService:
         longitude: float,
         qualified: Optional[str] = None,
         radius_km: float = DEFAULT_SEARCH_RADIUS_KM,
-    ) -> QuerySet[Applier]:
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+        include_distance: bool = True,
+    ) -> List[Tuple[Any, ...]]:
         """
         Search for appliers within a specified radius of a geographic point.
 
         Results are sorted by a penalized distance metric that combines actual distance
         with qualification status (non-YES statuses are penalized).
 
+        The penalty is constant within a qualified status, so the nearest appliers of
+        each status are fetched with the KNN (<->) operator, which walks the status's
+        partial GiST index on location in distance order and stops after
+        `offset + limit` rows. These
+        candidate queries only read the id and the sphere distance <-> yields. The
+        candidates are merged by penalized distance, the requested page is sliced
+        out, and only its rows are read in full, in one more query. The exact
+        ST_Distance (spheroid) is computed there, for at most `limit` rows, and only
+        when the caller wants it in the result.
+
         Args:
             latitude: Latitude of the search center point (-90 to 90)
             longitude: Longitude of the search center point (-180 to 180)
             qualified: Optional qualification status filter (YES, NO, PENDING)
             radius_km: Search radius in kilometers (default: 20)
+            limit: Maximum number of appliers to return (default: 100)
+            offset: Number of leading results to skip, for paging (default: 0)
+            include_distance: Whether to add the exact distance (default: True)
 
         Returns:
-            QuerySet: Filtered and annotated queryset of Applier objects with distance,
-                     ordered by penalized distance (distance × penalty multiplier)
+            list: Up to `limit` applier rows (APPLIER_VALUES_FIELDS tuples followed,
+                  with include_distance, by the distance in meters; ready for
+                  ApplierSerializer.from_values_list), ordered by penalized
+                  distance (distance × penalty multiplier)
         """
         # Create a Point for the search center (longitude, latitude order in GIS)
         search_point = Point(longitude, latitude, srid=WGS84_SRID)
@@ -59,37 +127,61 @@ class ApplierSearchService:
                 "longitude": longitude,
                 "qualified": qualified,
                 "radius_km": radius_km,
+                "limit": limit,
+                "offset": offset,
+                "include_distance": include_distance,
             },
         )
 
-        # Start with appliers that have location data
-        queryset = Applier.objects.filter(location__isnull=False).select_related("user")
-
-        # Filter by qualified status if provided
-        if qualified:
-            queryset = queryset.filter(qualified=qualified)
-
-        # Calculate distance and create a penalty multiplier based on qualified status
-        # YES: no penalty (1.0x), PENDING: (1.5x), NO: (2.0x), NULL: (3.0x)
-        # This is to satisfy the requirement to sort by distance and "relevance"
-        qualified_penalty = Case(
-            When(qualified=QUALIFIED_YES, then=1.0),
-            When(qualified=QUALIFIED_PENDING, then=1.5),
-            When(qualified=QUALIFIED_NO, then=2.0),
-            default=3.0,
-            output_field=FloatField(),
+        # Start with appliers that have location data within the radius.
+        # ST_DWithin only prefilters here, ordering is served by the KNN operator.
+        # Geography distances are in meters, so no D() conversion is needed.
+        queryset = Applier.objects.filter(location__isnull=False).filter(
+            location__dwithin=(search_point, radius_km * 1000.0)
         )
 
-        queryset = (
-            queryset.filter(location__distance_lte=(search_point, D(km=radius_km)))
-            .annotate(
-                distance=Distance("location", search_point),
-                qualified_penalty=qualified_penalty,
-                # Calculate penalized distance: actual_distance_km * penalty_multiplier
-                penalized_distance=F("distance") * F("qualified_penalty"),
+        # Filter by qualified status if provided, otherwise search every status
+        statuses = (qualified,) if qualified else ALL_STATUSES
+
+        # Geography literal so <-> compares geography to geography
+        knn_point = Value(search_point, output_field=GEOGRAPHY_FIELD)
+
+        # (penalized distance, id) pairs, so sorting breaks ties by id
+        candidates: List[Tuple[float, int]] = []
+        for status in statuses:
+            # Penalty multiplier based on qualified status
+            # YES: no penalty (1.0x), PENDING: (1.5x), NO: (2.0x), NULL: (3.0x)
+            # This is to satisfy the requirement to sort by distance and "relevance"
+            penalty = QUALIFIED_PENALTIES.get(status, DEFAULT_QUALIFIED_PENALTY)
+
+            # <-> on geography is the sphere distance in meters
+            rows = (
+                queryset.filter(qualified=status)
+                .annotate(knn_distance=GeometryDistance("location", knn_point))
+                .order_by("knn_distance")
+                .values_list("id", "knn_distance")[:offset + limit]
             )
-            .order_by("penalized_distance")
-        )
+            candidates.extend(
+                (knn_distance * penalty, applier_id) for applier_id, knn_distance in rows
+            )
+
+        candidates.sort()
+        page_ids = [applier_id for _, applier_id in candidates[offset:offset + limit]]
+        if not page_ids:
+            return []
+
+        page_queryset = Applier.objects.filter(id__in=page_ids)
+        fields: Tuple[str, ...] = ()
+        if include_distance:
+            # Plain float meters, skipping the per-row Distance (D) object
+            page_queryset = page_queryset.annotate(
+                distance=ExpressionWrapper(
+                    Distance("location", search_point), output_field=FloatField()
+                )
+            )
+            fields = ("distance",)
 
-        return queryset
-    
\ No newline at end of file
+        # The page comes back unordered, restore the penalized distance order
+        # (an applier deleted since the candidate queries is simply left out)
+        rows_by_id = {row[0]: row for row in page_queryset.with_coordinates(*fields)}
+        return [rows_by_id[applier_id] for applier_id in page_ids if applier_id in rows_by_id]
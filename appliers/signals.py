@@ -0,0 +1,24 @@
+"""
+Signal handlers for appliers application.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from appliers.models import Applier, User
+from appliers.services.search_service import clear_search_cache
+
+
+@receiver(post_save, sender=Applier)
+@receiver(post_delete, sender=Applier)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_search_cache(sender, **kwargs) -> None:
+    """
+    Search results embed applier and user columns, drop them on any change.
+
+    Deferred to the commit: bumped earlier, a concurrent search could still read
+    the old rows and cache them under the new version, and a rollback would
+    invalidate for nothing.
+    """
+    transaction.on_commit(clear_search_cache)
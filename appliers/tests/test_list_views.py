@@ -0,0 +1,71 @@
+"""
+Tests for the applier list endpoints.
+"""
+from django.test import Client
+from django.urls import reverse
+from appliers.models import User, Applier, ScreeningQuestion
+from appliers.tests.base import NoLoggingTestCase
+import json
+
+
+class ApplierListViewSetTestCase(NoLoggingTestCase):
+    """
+    Test cases for the endpoints listing appliers with more than 16 screening questions.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up test data: one applier with 17 screening questions, one with 16.
+        """
+        cls.user = User.objects.create(
+            external_id='user1',
+            first_name='John',
+            last_name='Doe',
+            email='john.doe@example.com',
+            phone='+491234567890',
+            resume='resumes/john.pdf',
+            cover_letter='I am interested...',
+            country='Germany'
+        )
+
+        cls.applier1, cls.applier2 = Applier.objects.bulk_create([
+            Applier(external_id='app1', user=cls.user, qualified='YES'),
+            Applier(external_id='app2', user=cls.user, qualified='NO'),
+        ])
+
+        ScreeningQuestion.objects.bulk_create(
+            [
+                ScreeningQuestion(application=cls.applier1, question='Why?', type='TEXT')
+                for _ in range(17)
+            ]
+            + [
+                ScreeningQuestion(application=cls.applier2, question='Why?', type='TEXT')
+                for _ in range(16)
+            ]
+        )
+
+    def setUp(self):
+        self.client = Client()
+
+    def get_list(self, url_name):
+        """Fetch a list endpoint and decode its (possibly streamed) JSON body."""
+        response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        if response.streaming:
+            return json.loads(b''.join(response.streaming_content))
+        return json.loads(response.content)
+
+    def test_list_returns_appliers_with_more_than_16_questions(self):
+        """Test that only the applier with 17 questions is listed."""
+        for url_name in ('appliers-list', 'appliers-list2'):
+            with self.subTest(url_name=url_name):
+                data = self.get_list(url_name)
+                self.assertEqual([item['external_id'] for item in data], ['app1'])
+                self.assertEqual(data[0]['user']['email'], 'john.doe@example.com')
+
+    def test_list_uses_a_single_query(self):
+        """Test that the user is joined instead of fetched per applier."""
+        for url_name in ('appliers-list', 'appliers-list2'):
+            with self.subTest(url_name=url_name), self.assertNumQueries(1):
+                self.get_list(url_name)
@@ -1,8 +1,10 @@
+from django.db import DatabaseError, transaction
 from django.test import Client
 from django.urls import reverse
-from decimal import Decimal
 from django.contrib.gis.geos import Point
+from appliers.constants import MAX_SEARCH_OFFSET
 from appliers.models import User, Applier
+from appliers.services.search_service import clear_search_cache
 from appliers.tests.base import NoLoggingTestCase
 import json
 
@@ -12,112 +14,116 @@ class SearchViewSetTestCase(NoLoggingTestCase):
     Test cases for the geolocation search endpoint.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up test data: create users and appliers with different locations.
+        Set up test data once per class: create users and appliers with different locations.
         Test location: Cologne, Germany (50.94, 6.96)
         """
-        self.client = Client()
-        self.search_url = '/api/v1/appliers/search'
-
-        # Create test users
-        self.user1 = User.objects.create(
-            external_id='user1',
-            first_name='John',
-            last_name='Doe',
-            email='john.doe@example.com',
-            phone='+491234567890',
-            resume='resumes/john.pdf',
-            cover_letter='I am interested...',
-            country='Germany'
-        )
-
-        self.user2 = User.objects.create(
-            external_id='user2',
-            first_name='Jane',
-            last_name='Smith',
-            email='jane.smith@example.com',
-            phone='+491234567891',
-            resume='resumes/jane.pdf',
-            cover_letter='Looking forward...',
-            country='Germany'
-        )
-
-        self.user3 = User.objects.create(
-            external_id='user3',
-            first_name='Bob',
-            last_name='Johnson',
-            email='bob.johnson@example.com',
-            phone='+491234567892',
-            resume='resumes/bob.pdf',
-            cover_letter='Excited to apply...',
-            country='Germany'
-        )
-
-        self.user4 = User.objects.create(
-            external_id='user4',
-            first_name='Alice',
-            last_name='Williams',
-            email='alice.williams@example.com',
-            phone='+491234567893',
-            resume='resumes/alice.pdf',
-            cover_letter='Great opportunity...',
-            country='Germany'
-        )
+        cls.search_url = reverse('appliers-search')
+
+        # Create test users (bulk_create returns them with their ids on PostgreSQL)
+        cls.user1, cls.user2, cls.user3, cls.user4 = User.objects.bulk_create([
+            User(
+                external_id='user1',
+                first_name='John',
+                last_name='Doe',
+                email='john.doe@example.com',
+                phone='+491234567890',
+                resume='resumes/john.pdf',
+                cover_letter='I am interested...',
+                country='Germany'
+            ),
+            User(
+                external_id='user2',
+                first_name='Jane',
+                last_name='Smith',
+                email='jane.smith@example.com',
+                phone='+491234567891',
+                resume='resumes/jane.pdf',
+                cover_letter='Looking forward...',
+                country='Germany'
+            ),
+            User(
+                external_id='user3',
+                first_name='Bob',
+                last_name='Johnson',
+                email='bob.johnson@example.com',
+                phone='+491234567892',
+                resume='resumes/bob.pdf',
+                cover_letter='Excited to apply...',
+                country='Germany'
+            ),
+            User(
+                external_id='user4',
+                first_name='Alice',
+                last_name='Williams',
+                email='alice.williams@example.com',
+                phone='+491234567893',
+                resume='resumes/alice.pdf',
+                cover_letter='Great opportunity...',
+                country='Germany'
+            ),
+        ])
+
+        (
+            cls.applier1,
+            cls.applier2,
+            cls.applier3,
+            cls.applier4,
+            cls.applier5,
+        ) = Applier.objects.bulk_create([
+            # Applier 1: ~0.5 km from center - QUALIFIED YES
+            Applier(
+                external_id='app1',
+                user=cls.user1,
+                qualified='YES',
+                location=Point(6.9583, 50.9413, srid=4326),
+                source_product='Internal',
+                source_is_premium=False
+            ),
+            # Applier 2: ~15 km from center - QUALIFIED NO
+            Applier(
+                external_id='app2',
+                user=cls.user2,
+                qualified='NO',
+                location=Point(7.1427, 50.8659, srid=4326),
+                source_product='Indeed',
+                source_is_premium=False
+            ),
+            # Applier 3: ~35 km from center - QUALIFIED YES
+            Applier(
+                external_id='app3',
+                user=cls.user3,
+                qualified='YES',
+                location=Point(6.7735, 51.2277, srid=4326),
+                source_product='LinkedIn',
+                source_is_premium=False
+            ),
+            # Applier 4: Near center (~2 km) - QUALIFIED PENDING
+            Applier(
+                external_id='app4',
+                user=cls.user4,
+                qualified='PENDING',
+                location=Point(6.9700, 50.9500, srid=4326),
+                source_product='Internal',
+                source_is_premium=False
+            ),
+            # Applier 5: No location data
+            Applier(
+                external_id='app5',
+                user=cls.user1,
+                qualified='YES',
+                source_product='Internal',
+                source_is_premium=False
+            ),
+        ])
 
-        # Applier 1: ~0.5 km from center - QUALIFIED YES
-        self.applier1 = Applier.objects.create(
-            external_id='app1',
-            user=self.user1,
-            qualified='YES',
-            latitude=Decimal('50.9413'),
-            longitude=Decimal('6.9583'),
-            location=Point(6.9583, 50.9413, srid=4326),
-            source={'channel': 'website'}
-        )
-
-        # Applier 2: ~15 km from center - QUALIFIED NO
-        self.applier2 = Applier.objects.create(
-            external_id='app2',
-            user=self.user2,
-            qualified='NO',
-            latitude=Decimal('50.8659'),
-            longitude=Decimal('7.1427'),
-            location=Point(7.1427, 50.8659, srid=4326),
-            source={'channel': 'referral'}
-        )
-
-        # Applier 3: ~35 km from center - QUALIFIED YES
-        self.applier3 = Applier.objects.create(
-            external_id='app3',
-            user=self.user3,
-            qualified='YES',
-            latitude=Decimal('51.2277'),
-            longitude=Decimal('6.7735'),
-            location=Point(6.7735, 51.2277, srid=4326),
-            source={'channel': 'linkedin'}
-        )
-
-        # Applier 4: Near center (~2 km) - QUALIFIED PENDING
-        self.applier4 = Applier.objects.create(
-            external_id='app4',
-            user=self.user4,
-            qualified='PENDING',
-            latitude=Decimal('50.9500'),
-            longitude=Decimal('6.9700'),
-            location=Point(6.9700, 50.9500, srid=4326),
-            source={'channel': 'website'}
-        )
-
-        # Applier 5: No location data
-        self.applier5 = Applier.objects.create(
-            external_id='app5',
-            user=self.user1,
-            qualified='YES',
-            latitude=None,
-            longitude=None,
-            source={'channel': 'website'}
-        )
+    def setUp(self):
+        self.client = Client()
+        # Neither bulk_create nor the per-test rollback sends signals, so start
+        # every test with an empty search cache
+        clear_search_cache()
 
     def test_search_without_lat_parameter(self):
         """Test that the endpoint returns 400 when lat parameter is missing."""
@@ -238,6 +244,20 @@ class SearchViewSetTestCase(NoLoggingTestCase):
         self.assertEqual(data[0]['external_id'], 'app4')
         self.assertEqual(data[0]['qualified'], 'PENDING')
 
+    def test_search_with_lowercase_qualified_filter(self):
+        """Test that the qualified filter is case-insensitive."""
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'qualified': 'pending'
+        })
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['external_id'], 'app4')
+        self.assertEqual(data[0]['qualified'], 'PENDING')
+
     def test_search_excludes_appliers_without_location(self):
         """Test that appliers without location data are excluded."""
         response = self.client.get(self.search_url, {
@@ -283,6 +303,38 @@ class SearchViewSetTestCase(NoLoggingTestCase):
         self.assertIn('last_name', user_data)
         self.assertIn('email', user_data)
 
+        # Check source structure
+        self.assertEqual(applier_data['source'], {'product': 'Internal', 'isPremium': False})
+
+    def test_search_applier_without_source(self):
+        """Test that an applier without source data serializes source as null."""
+        user = User.objects.create(
+            external_id='user6',
+            first_name='Dana',
+            last_name='White',
+            email='dana@example.com',
+            phone='+491234567895',
+            resume='resumes/dana.pdf',
+            cover_letter='Test',
+            country='Germany'
+        )
+        Applier.objects.create(
+            external_id='app8',
+            user=user,
+            qualified='YES',
+            location=Point(6.9600, 50.9400, srid=4326),
+        )
+
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'qualified': 'YES'
+        })
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data[0]['external_id'], 'app8')
+        self.assertIsNone(data[0]['source'])
+
     def test_search_with_custom_radius(self):
         """Test search with custom radius parameter."""
         # Search with 10km radius (should exclude applier2 which is ~15km away)
@@ -299,6 +351,82 @@ class SearchViewSetTestCase(NoLoggingTestCase):
         for applier_data in data:
             self.assertLessEqual(applier_data['distance_km'], 10)
 
+    def test_search_with_limit_and_offset(self):
+        """Test that limit/offset page through the penalized distance ordering."""
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'limit': '2'
+        })
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual([item['external_id'] for item in data], ['app1', 'app4'])
+
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'limit': '2',
+            'offset': '1'
+        })
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual([item['external_id'] for item in data], ['app4', 'app2'])
+
+    def test_search_with_invalid_limit_parameter(self):
+        """Test that the endpoint returns 400 when limit is out of range."""
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'limit': '0'
+        })
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.content)
+        self.assertIn('Limit must be at least 1', data['error'])
+
+    def test_search_with_offset_beyond_maximum(self):
+        """Test that the endpoint returns 400 when offset exceeds MAX_SEARCH_OFFSET."""
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'offset': str(MAX_SEARCH_OFFSET + 1)
+        })
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.content)
+        self.assertIn('Offset must not exceed', data['error'])
+
+    def test_search_reads_page_rows_in_one_query(self):
+        """Test that one candidate query per status is followed by a single page query."""
+        # YES, PENDING, NO and NULL candidates, then the full rows of the page
+        with self.assertNumQueries(5):
+            response = self.client.get(self.search_url, {'lat': '50.94', 'lon': '6.96'})
+        self.assertEqual(len(json.loads(response.content)), 3)
+
+    def test_search_without_distance(self):
+        """Test that distance=0 omits distance_km but keeps the ranking."""
+        response = self.client.get(self.search_url, {
+            'lat': '50.94',
+            'lon': '6.96',
+            'distance': '0'
+        })
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+
+        self.assertEqual([item['external_id'] for item in data], ['app1', 'app4', 'app2'])
+        for applier_data in data:
+            self.assertNotIn('distance_km', applier_data)
+
+    def test_search_with_invalid_distance_parameter(self):
+        """Test that the endpoint returns 400 for distance values other than true/false/1/0."""
+        for value in ('no', 'abc'):
+            response = self.client.get(self.search_url, {
+                'lat': '50.94',
+                'lon': '6.96',
+                'distance': value
+            })
+            self.assertEqual(response.status_code, 400)
+            data = json.loads(response.content)
+            self.assertIn('Invalid distance parameter', data['error'])
+
     def test_search_with_no_results(self):
         """Test search that returns no results."""
         # Search in a location far from any appliers
@@ -331,10 +459,9 @@ class SearchViewSetTestCase(NoLoggingTestCase):
             external_id='app6',
             user=user5,
             qualified='YES',
-            latitude=Decimal('50.85'),
-            longitude=Decimal('6.96'),
             location=Point(6.96, 50.85, srid=4326),
-            source={'channel': 'test'}
+            source_product='Indeed',
+            source_is_premium=False
         )
 
         # NO at 1km: penalized = 1 * 2.0 = 2.0
@@ -343,10 +470,9 @@ class SearchViewSetTestCase(NoLoggingTestCase):
             external_id='app7',
             user=user5,
             qualified='NO',
-            latitude=Decimal('50.9450'),
-            longitude=Decimal('6.9650'),
             location=Point(6.9650, 50.9450, srid=4326),
-            source={'channel': 'test'}
+            source_product='Indeed',
+            source_is_premium=False
         )
 
         response = self.client.get(self.search_url, {
@@ -384,3 +510,65 @@ class SearchViewSetTestCase(NoLoggingTestCase):
 
         # Key insight: NO at 1km (penalty=2.0) ranks better than PENDING at 2km (penalty=3.0)
         # This demonstrates the merged metric working correctly
+
+    def test_search_served_from_cache(self):
+        """Test that a repeated search is answered without querying the database."""
+        params = {'lat': '50.94', 'lon': '6.96'}
+        response = self.client.get(self.search_url, params)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.search_url, params)
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response.content, response.content)
+
+    def test_search_cache_invalidated_on_save(self):
+        """Test that saving an applier drops cached search results."""
+        params = {'lat': '50.94', 'lon': '6.96', 'qualified': 'YES'}
+        response = self.client.get(self.search_url, params)
+        self.assertEqual(len(json.loads(response.content)), 1)
+
+        # Move applier3 (~35 km) next to the search center
+        self.applier3.location = Point(6.9600, 50.9400, srid=4326)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.applier3.save()
+
+        response = self.client.get(self.search_url, params)
+        data = json.loads(response.content)
+        self.assertEqual([item['external_id'] for item in data], ['app3', 'app1'])
+
+    def test_search_cache_invalidated_on_commit(self):
+        """Test that the cache is only invalidated once the saving transaction commits."""
+        params = {'lat': '50.94', 'lon': '6.96', 'qualified': 'YES'}
+        self.client.get(self.search_url, params)
+
+        self.applier3.location = Point(6.9600, 50.9400, srid=4326)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                self.applier3.save()
+
+                # Not committed yet, the cached response is still current
+                with self.assertNumQueries(0):
+                    self.client.get(self.search_url, params)
+            self.assertEqual(len(callbacks), 1)
+
+        response = self.client.get(self.search_url, params)
+        data = json.loads(response.content)
+        self.assertEqual([item['external_id'] for item in data], ['app3', 'app1'])
+
+    def test_search_cache_kept_on_rollback(self):
+        """Test that a rolled back save leaves cached search results in place."""
+        params = {'lat': '50.94', 'lon': '6.96', 'qualified': 'YES'}
+        self.client.get(self.search_url, params)
+
+        self.applier3.location = Point(6.9600, 50.9400, srid=4326)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.applier3.save()
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+        self.assertEqual(callbacks, [])
+
+        with self.assertNumQueries(0):
+            self.client.get(self.search_url, params)
@@ -5,7 +5,7 @@ from appliers.views.list2 import Applier2ViewSet
 from appliers.views.search import SearchViewSet
 
 urlpatterns = [
-    path("list/", Applier1ViewSet.as_view()),
-    path("list2/", Applier2ViewSet.as_view()),
+    path("list/", Applier1ViewSet.as_view(), name="appliers-list"),
+    path("list2/", Applier2ViewSet.as_view(), name="appliers-list2"),
     path("search", SearchViewSet.as_view(), name="appliers-search"),
 ]
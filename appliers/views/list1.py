@@ -1,18 +1,23 @@
 from django.views import View
-from django.db.models import Count
-from django.http import JsonResponse
-from appliers.models import Applier
+from django.db.models import Exists, OuterRef
+from appliers.models import Applier, ScreeningQuestion
 from appliers.serializers import ApplierSerializer
+from appliers.views.responses import STREAM_CHUNK_SIZE, json_stream_response
 
 
 class Applier1ViewSet(View):
     def get(self, request, *args, **kwargs):
+        # "more than 16 questions" is "a 17th question exists": the EXISTS probe
+        # stops at that row instead of grouping and counting every question
+        seventeenth_question = ScreeningQuestion.objects.filter(
+            application=OuterRef("pk")
+        ).order_by()[16:17]
         appliers_query = (
-            Applier.objects.select_related("user")
-            .annotate(question_count=Count("screening_questions"))
-            .filter(question_count__gt=16)
+            Applier.objects.filter(Exists(seventeenth_question))
+            .with_coordinates()
         )
 
-        data = [ApplierSerializer.to_dict(applier) for applier in appliers_query]
-
-        return JsonResponse(data, safe=False)
\ No newline at end of file
+        return json_stream_response(
+            ApplierSerializer.from_values_list(row)
+            for row in appliers_query.iterator(chunk_size=STREAM_CHUNK_SIZE)
+        )
@@ -1,8 +1,8 @@
 from django.views import View
 from django.db.models import Count
-from django.http import JsonResponse
 from appliers.models import Applier, ScreeningQuestion
 from appliers.serializers import ApplierSerializer
+from appliers.views.responses import STREAM_CHUNK_SIZE, json_stream_response
 
 
 class Applier2ViewSet(View):
@@ -12,9 +12,14 @@ class Applier2ViewSet(View):
             question_count=Count("id")
         ).filter(question_count__gt=16)
 
-        ids = list(map(lambda x: x["application_id"], questions_query))
-        appliers_query = Applier.objects.select_related("user").filter(id__in=ids)
+        # kept as a subquery of the same statement, so the ids never round-trip
+        # through Python
+        appliers_query = (
+            Applier.objects.filter(id__in=questions_query.values("application_id"))
+            .with_coordinates()
+        )
 
-        data = [ApplierSerializer.to_dict(applier) for applier in appliers_query]
-
-        return JsonResponse(data, safe=False)
+        return json_stream_response(
+            ApplierSerializer.from_values_list(row)
+            for row in appliers_query.iterator(chunk_size=STREAM_CHUNK_SIZE)
+        )
@@ -0,0 +1,66 @@
+"""
+JSON response helpers shared by the appliers views.
+"""
+import itertools
+from typing import Any, Iterable, Iterator
+
+import orjson
+from django.http import HttpResponse, StreamingHttpResponse
+
+# Datetimes as RFC 3339 with a Z suffix for UTC, close to DjangoJSONEncoder
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+# Rows fetched per server-side cursor round trip and encoded per streamed chunk
+STREAM_CHUNK_SIZE = 2000
+
+
+def dumps(data: Any) -> bytes:
+    """Encode data to JSON bytes with orjson."""
+    return orjson.dumps(data, option=ORJSON_OPTIONS)
+
+
+def json_response(data: Any, status: int = 200) -> HttpResponse:
+    """
+    Build a JSON HttpResponse encoded with orjson instead of JsonResponse.
+
+    Args:
+        data: Any orjson-serializable value (lists need no safe=False)
+        status: HTTP status code
+
+    Returns:
+        HttpResponse: application/json response
+    """
+    return encoded_json_response(dumps(data), status=status)
+
+
+def encoded_json_response(body: bytes, status: int = 200) -> HttpResponse:
+    """Wrap an already encoded JSON body (e.g. from the cache) in a response."""
+    return HttpResponse(body, status=status, content_type="application/json")
+
+
+def stream_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items as a JSON array, one chunk of STREAM_CHUNK_SIZE items at a time."""
+    yield b"["
+    separator = b""
+    for chunk in itertools.batched(items, STREAM_CHUNK_SIZE):
+        yield separator + b",".join(dumps(item) for item in chunk)
+        separator = b","
+    yield b"]"
+
+
+def json_stream_response(items: Iterable[Any]) -> StreamingHttpResponse:
+    """
+    Build a streamed JSON array response.
+
+    Pass a lazy iterable (e.g. over QuerySet.iterator()) so memory stays bounded
+    by STREAM_CHUNK_SIZE instead of growing with the result set.
+
+    Args:
+        items: Iterable of orjson-serializable values
+
+    Returns:
+        StreamingHttpResponse: application/json response
+    """
+    return StreamingHttpResponse(
+        stream_json_array(items), content_type="application/json"
+    )
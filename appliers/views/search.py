@@ -2,10 +2,13 @@ import logging
 from typing import Dict, List
 
 from django.views import View
-from django.http import JsonResponse, HttpRequest
-from appliers.services.search_service import ApplierSearchService
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from appliers.constants import SEARCH_CACHE_TIMEOUT
+from appliers.services.search_service import ApplierSearchService, search_cache_key
 from appliers.forms.search_form import ApplierSearchForm
 from appliers.serializers import ApplierSerializer
+from appliers.views.responses import dumps, encoded_json_response, json_response
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +23,18 @@ class SearchViewSet(View):
     - lon (required): Longitude of the search center point
     - qualified (optional): Filter by qualification status (YES, NO, PENDING)
     - radius (optional): Search radius in kilometers (default: 20km)
+    - limit (optional): Page size (default: 100, at most 500)
+    - offset (optional): Number of results to skip (default: 0)
+    - distance (optional): Set to 0/false to omit distance_km, 1/true to keep it
+      (default: included)
+
+    Results are ranked by the sphere distance the KNN (<->) operator yields, while
+    distance_km is the exact spheroid distance. The two differ by at most about 0.5%,
+    so results with nearly equal distances may appear slightly out of order by
+    distance_km.
     """
 
-    def get(self, request: HttpRequest) -> JsonResponse:
+    def get(self, request: HttpRequest) -> HttpResponse:
         """
         Handle GET request for applier search.
 
@@ -30,29 +42,30 @@ class SearchViewSet(View):
             request: Django HTTP request object
 
         Returns:
-            JsonResponse: List of matching appliers with distance information
+            HttpResponse: JSON list of matching appliers with distance information
         """
-        # Parse and validate parameters
+        # Parse and validate parameters, the search point is only built once they pass
         form = ApplierSearchForm(request.GET)
         if not form.is_valid():
-            return JsonResponse({"error": form.get_error_message()}, status=400)
-
-        params = {
-            "latitude": form.cleaned_data["lat"],
-            "longitude": form.cleaned_data["lon"],
-            "qualified": form.cleaned_data["qualified"],
-            "radius_km": form.cleaned_data["radius"],
-        }
-
-        queryset = ApplierSearchService.search_by_location(
-            latitude=params["latitude"],
-            longitude=params["longitude"],
-            qualified=params["qualified"],
-            radius_km=params["radius_km"],
-        )
+            return json_response({"error": form.get_error_message()}, status=400)
+
+        params = form.get_search_params()
+
+        # Identical searches within SEARCH_CACHE_TIMEOUT get the stored JSON body,
+        # skipping the queries and the encoding (invalidated by appliers.signals)
+        cache_key = search_cache_key(**params)
+        body = cache.get(cache_key)
+        if body is not None:
+            logger.info("Applier search served from cache", extra={"params": params})
+            return encoded_json_response(body)
+
+        rows = ApplierSearchService.search_by_location(**params)
 
         data: List[Dict] = [
-            ApplierSerializer.to_dict(applier, include_distance=True) for applier in queryset
+            ApplierSerializer.from_values_list(
+                row, include_distance=params["include_distance"]
+            )
+            for row in rows
         ]
 
         logger.info(
@@ -60,4 +73,6 @@ class SearchViewSet(View):
             extra={"result_count": {"params": params, "results": len(data)}},
         )
 
-        return JsonResponse(data, safe=False)
+        body = dumps(data)
+        cache.set(cache_key, body, SEARCH_CACHE_TIMEOUT)
+        return encoded_json_response(body)